@@ -22,8 +22,22 @@ class AjaxCloudClient:
         self._backend_url = backend_url.rstrip("/")
         self._token = token
 
+    @property
+    def token(self) -> str:
+        """Return the bearer token used for requests."""
+        return self._token
+
+    @token.setter
+    def token(self, token: str) -> None:
+        """Set the bearer token used for requests."""
+        self._token = token
+
     async def _request(
-        self, method: str, endpoint: str, data: dict[str, Any] | None = None
+        self,
+        method: str,
+        endpoint: str,
+        data: dict[str, Any] | None = None,
+        params: dict[str, Any] | None = None,
     ) -> dict[str, Any]:
         """Make a request to the backend."""
         url = f"{self._backend_url}/api/v1{endpoint}"
@@ -34,24 +48,37 @@ class AjaxCloudClient:
 
         try:
             async with self._session.request(
-                method, url, json=data, headers=headers, timeout=TIMEOUT
+                method,
+                url,
+                json=data,
+                params=params,
+                headers=headers,
+                timeout=TIMEOUT,
             ) as response:
                 response.raise_for_status()
                 return await response.json()
         except aiohttp.ClientError as err:
-            _LOGGER.error("Error communicating with backend: %s", err)
+            # Callers decide how loudly to report failures
+            _LOGGER.debug("Error communicating with backend: %s", err)
             raise
-        except asyncio.TimeoutError as err:
-            _LOGGER.error("Timeout communicating with backend")
+        except asyncio.TimeoutError:
+            _LOGGER.debug("Timeout communicating with backend")
             raise
 
     async def async_authenticate(self, email: str) -> dict[str, Any]:
         """Request authentication/registration."""
         return await self._request("POST", "/auth/register", {"email": email})
 
-    async def async_check_status(self) -> dict[str, Any]:
-        """Check connection status and approval."""
-        return await self._request("GET", "/auth/status")
+    async def async_check_status(self, wait: int | None = None) -> dict[str, Any]:
+        """Check connection status and approval.
+
+        When ``wait`` is given the backend is asked to hold the request open
+        for up to that many seconds until the status changes (long-poll).
+        Backends that honour it include ``"long_poll": true`` in the reply;
+        backends without long-poll support ignore it and answer immediately.
+        """
+        params = {"wait": wait} if wait else None
+        return await self._request("GET", "/auth/status", params=params)
 
     async def async_get_devices(self) -> dict[str, Any]:
         """Get all devices and their states."""
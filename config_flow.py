@@ -1,9 +1,13 @@
 """Config flow for Ajax Cloud integration."""
 from __future__ import annotations
 
+import asyncio
 import logging
+import random
+import time
 from typing import Any
 
+import aiohttp
 import voluptuous as vol
 
 from homeassistant import config_entries
@@ -24,6 +28,24 @@ STEP_USER_DATA_SCHEMA = vol.Schema(
     }
 )
 
+# Approval watcher: seconds the backend may hold a long-poll status request
+LONG_POLL_WAIT = 25
+# Exponential backoff bounds (seconds) when the backend does not long-poll
+BACKOFF_MIN = 2
+BACKOFF_MAX = 60
+# Consecutive failed status checks before giving up
+MAX_STATUS_ERRORS = 5
+# Seconds to wait for approval before giving up on the flow
+MAX_PENDING_TIME = 30 * 60
+
+STATUS_PENDING = "pending"
+STATUS_APPROVED = "approved"
+STATUS_REJECTED = "rejected"
+STATUS_CANNOT_CONNECT = "cannot_connect"
+STATUS_INVALID_AUTH = "invalid_auth"
+STATUS_TIMEOUT = "timeout"
+STATUS_UNKNOWN = "unknown"
+
 
 class AjaxCloudConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     """Handle a config flow for Ajax Cloud."""
@@ -35,6 +57,9 @@ class AjaxCloudConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         self._email: str | None = None
         self._backend_url: str | None = None
         self._token: str | None = None
+        self._client: AjaxCloudClient | None = None
+        self._watch_task: asyncio.Task[str] | None = None
+        self._watch_result: str | None = None
 
     async def async_step_user(
         self, user_input: dict[str, Any] | None = None
@@ -49,22 +74,16 @@ class AjaxCloudConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             try:
                 # Request registration/authentication
                 session = async_get_clientsession(self.hass)
-                client = AjaxCloudClient(session, self._backend_url, "")
-                result = await client.async_authenticate(self._email)
-                
+                self._client = AjaxCloudClient(session, self._backend_url, "")
+                result = await self._client.async_authenticate(self._email)
+
                 self._token = result.get("token")
-                
-                if result.get("status") == "pending":
+                self._client.token = self._token
+
+                if result.get("status") == STATUS_PENDING:
                     return await self.async_step_pending()
-                elif result.get("status") == "approved":
-                    return self.async_create_entry(
-                        title=f"Ajax Cloud ({self._email})",
-                        data={
-                            CONF_EMAIL: self._email,
-                            CONF_BACKEND_URL: self._backend_url,
-                            CONF_TOKEN: self._token,
-                        },
-                    )
+                elif result.get("status") == STATUS_APPROVED:
+                    return self._async_create_entry()
             except Exception as err:
                 _LOGGER.error("Error during authentication: %s", err)
                 errors["base"] = "cannot_connect"
@@ -76,33 +95,128 @@ class AjaxCloudConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     async def async_step_pending(
         self, user_input: dict[str, Any] | None = None
     ) -> FlowResult:
-        """Handle pending approval step."""
-        if user_input is not None:
+        """Wait in the background for the registration to be approved."""
+        if self._watch_task is None:
+            self._watch_task = self.hass.async_create_background_task(
+                self._async_watch_approval(),
+                name=f"{DOMAIN} approval watcher {self.flow_id}",
+            )
+
+        if not self._watch_task.done():
+            return self.async_show_progress(
+                step_id="pending",
+                progress_action="wait_for_approval",
+                description_placeholders={"email": self._email},
+                progress_task=self._watch_task,
+            )
+
+        try:
+            self._watch_result = self._watch_task.result()
+        except Exception as err:
+            _LOGGER.error("Error checking status: %s", err)
+            self._watch_result = STATUS_CANNOT_CONNECT
+        self._watch_task = None
+
+        return self.async_show_progress_done(next_step_id="finish")
+
+    async def async_step_finish(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Create the entry or abort once the approval watcher has finished."""
+        if self._watch_result == STATUS_APPROVED:
+            return self._async_create_entry()
+        return self.async_abort(reason=self._watch_result)
+
+    async def _async_watch_approval(self) -> str:
+        """Poll the backend until the registration is approved or rejected.
+
+        Long-poll is tried first. The backend supports it only if a pending
+        reply carries ``"long_poll": true``; such replies are followed by the
+        next long-poll request straight away, unless the reply came back in
+        under half of LONG_POLL_WAIT, in which case a jittered BACKOFF_MIN
+        pause is taken first so a backend that does not actually hold the
+        request is never hammered. A pending reply without that field means
+        the wait parameter was ignored, so the watcher switches to
+        exponential backoff with jitter for the rest of the flow. The backoff
+        schedule restarts at BACKOFF_MIN on that switch and then only grows,
+        across both errors and pending replies, up to BACKOFF_MAX. Gives up
+        after MAX_PENDING_TIME seconds.
+        """
+        deadline = time.monotonic() + MAX_PENDING_TIME
+        long_poll = True
+        delay = BACKOFF_MIN
+        errors = 0
+
+        while True:
+            if time.monotonic() >= deadline:
+                _LOGGER.warning(
+                    "Registration for %s was not approved in time", self._email
+                )
+                return STATUS_TIMEOUT
+            started = time.monotonic()
             try:
-                # Check if approved
-                session = async_get_clientsession(self.hass)
-                client = AjaxCloudClient(session, self._backend_url, self._token)
-                result = await client.async_check_status()
-                
-                if result.get("status") == "approved":
-                    return self.async_create_entry(
-                        title=f"Ajax Cloud ({self._email})",
-                        data={
-                            CONF_EMAIL: self._email,
-                            CONF_BACKEND_URL: self._backend_url,
-                            CONF_TOKEN: self._token,
-                        },
+                result = await self._client.async_check_status(
+                    wait=LONG_POLL_WAIT if long_poll else None
+                )
+            except (aiohttp.ClientError, asyncio.TimeoutError) as err:
+                if (
+                    isinstance(err, aiohttp.ClientResponseError)
+                    and 400 <= err.status < 500
+                ):
+                    if err.status in (401, 403):
+                        _LOGGER.error("Registration token was refused: %s", err)
+                        return STATUS_INVALID_AUTH
+                    if long_poll:
+                        # The backend may reject the unknown wait parameter
+                        _LOGGER.debug(
+                            "Long-poll status check refused (%s), polling instead",
+                            err.status,
+                        )
+                        long_poll = False
+                        delay = BACKOFF_MIN
+                        continue
+                    _LOGGER.error("Error checking status: %s", err)
+                    return STATUS_CANNOT_CONNECT
+                errors += 1
+                if errors >= MAX_STATUS_ERRORS:
+                    _LOGGER.error("Error checking status: %s", err)
+                    return STATUS_CANNOT_CONNECT
+                _LOGGER.debug("Status check failed (%s), retrying", err)
+            else:
+                errors = 0
+                status = result.get("status")
+                if status in (STATUS_APPROVED, STATUS_REJECTED):
+                    return status
+                if status != STATUS_PENDING:
+                    _LOGGER.error("Unexpected registration status: %s", status)
+                    return STATUS_UNKNOWN
+                if long_poll:
+                    if result.get("long_poll") is True:
+                        if time.monotonic() - started >= LONG_POLL_WAIT / 2:
+                            continue
+                        # The backend did not hold the request, keep a floor
+                        await asyncio.sleep(
+                            random.uniform(BACKOFF_MIN, 2 * BACKOFF_MIN)
+                        )
+                        continue
+                    _LOGGER.debug(
+                        "Backend does not support long-poll, using backoff"
                     )
-                elif result.get("status") == "rejected":
-                    return self.async_abort(reason="rejected")
-            except Exception as err:
-                _LOGGER.error("Error checking status: %s", err)
-                return self.async_abort(reason="cannot_connect")
-
-        return self.async_show_form(
-            step_id="pending",
-            description_placeholders={
-                "email": self._email,
-                "message": "Your registration is pending approval. Please wait for the administrator to approve your access.",
+                    long_poll = False
+                    delay = BACKOFF_MIN
+
+            await asyncio.sleep(
+                min(random.uniform(delay / 2, delay), deadline - time.monotonic())
+            )
+            delay = min(delay * 2, BACKOFF_MAX)
+
+    def _async_create_entry(self) -> FlowResult:
+        """Create the config entry for the registered account."""
+        return self.async_create_entry(
+            title=f"Ajax Cloud ({self._email})",
+            data={
+                CONF_EMAIL: self._email,
+                CONF_BACKEND_URL: self._backend_url,
+                CONF_TOKEN: self._token,
             },
         )